@@ -75,8 +75,13 @@ def residuals(X, y, beta):
 @njit
 def _lts_single_sample(X, y, sample_size, max_iterations, eps=1e-12):
 
-    # randomly draw 2 points for the initial fit
-    sample = np.random.choice(len(y), 2, replace=False)
+    # randomly draw 2 distinct points for the initial fit,
+    # np.random.choice(..., replace=False) would permute all indices
+    first = np.random.randint(len(y))
+    second = np.random.randint(len(y) - 1)
+    if second >= first:
+        second += 1
+    sample = np.array([first, second])
 
     # perform the initial fit
     beta = linear_regression(X[sample], y[sample])
@@ -2,6 +2,7 @@
 High level image processing  (ImageProcessor Component)
 """
 
+import logging
 
 from ..containers import (
     ArrayEventContainer,
@@ -181,7 +182,11 @@ class ImageProcessor(TelescopeComponent):
                 peak_time=dl1_camera.peak_time,
             )
 
-            self.log.debug("params: %s", dl1_camera.parameters.as_dict(recursive=True))
+            # building the dict is costly, only do it if it is actually logged
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    "params: %s", dl1_camera.parameters.as_dict(recursive=True)
+                )
 
             if (
                 self._is_simulation
@@ -194,9 +199,8 @@ class ImageProcessor(TelescopeComponent):
                     signal_pixels=sim_camera.true_image > 0,
                     peak_time=None,  # true image from simulation has no peak time
                 )
-                self.log.debug(
-                    "sim params: %s",
-                    event.simulation.tel[tel_id].true_parameters.as_dict(
-                        recursive=True
-                    ),
-                )
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(
+                        "sim params: %s",
+                        sim_camera.true_parameters.as_dict(recursive=True),
+                    )
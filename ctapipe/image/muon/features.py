@@ -21,7 +21,7 @@ def mean_squared_error(pixel_x, pixel_y, weights, radius, center_x, center_y):
     center_y: float
         y coordinate of the ring center
     """
-    r = np.sqrt((center_x - pixel_x) ** 2 + (center_y - pixel_y) ** 2)
+    r = np.hypot(center_x - pixel_x, center_y - pixel_y)
     return np.average((r - radius) ** 2, weights=weights)
 
 
@@ -52,7 +52,7 @@ def intensity_ratio_inside_ring(
         width of the ring
     """
 
-    pixel_r = np.sqrt((center_x - pixel_x) ** 2 + (center_y - pixel_y) ** 2)
+    pixel_r = np.hypot(center_x - pixel_x, center_y - pixel_y)
     mask = np.logical_and(
         pixel_r >= radius - 0.5 * width, pixel_r <= radius + 0.5 * width
     )
@@ -109,9 +109,10 @@ class SubarrayDescription:
     def tel_coords(self):
         """ returns telescope positions as astropy.coordinates.SkyCoord"""
 
-        pos_x = np.array([p[0].to("m").value for p in self.positions.values()]) * u.m
-        pos_y = np.array([p[1].to("m").value for p in self.positions.values()]) * u.m
-        pos_z = np.array([p[2].to("m").value for p in self.positions.values()]) * u.m
+        # convert all positions at once instead of element by element,
+        # reshape keeps the (n_tels, 3) shape for an empty subarray
+        positions = u.Quantity(list(self.positions.values()), u.m).reshape(-1, 3)
+        pos_x, pos_y, pos_z = positions.T
 
         return SkyCoord(x=pos_x, y=pos_y, z=pos_z, frame=GroundFrame())
 
@@ -135,9 +136,9 @@ class SubarrayDescription:
         If the tel_ids are not contiguous, gaps will be filled in by -1.
         For a more compact representation use the `tel_indices`
         """
-        idx = np.zeros(np.max(self.tel_ids) + 1, dtype=int) - 1  # start with -1
-        for key, val in self.tel_indices.items():
-            idx[key] = val
+        idx = np.full(np.max(self.tel_ids) + 1, -1, dtype=int)  # start with -1
+        # tel_ids is in the same order as tel_indices
+        idx[self.tel_ids] = np.arange(len(self.tel_ids))
         return idx
 
     def tel_ids_to_indices(self, tel_ids):
@@ -29,6 +29,42 @@ logger = logging.getLogger(__name__)
 COMPATIBLE_DL1_VERSIONS = ["v1.0.0", "v1.0.1", "v1.0.2"]
 
 
+def _group_rows_by_event(obs_ids, event_ids):
+    """
+    Map each (obs_id, event_id) to the indices of the rows belonging to it.
+
+    The rows of each event are returned in their original order.
+
+    Parameters
+    ----------
+    obs_ids: np.ndarray
+        obs_id of each row
+    event_ids: np.ndarray
+        event_id of each row
+
+    Returns
+    -------
+    dict:
+        mapping (obs_id, event_id) to an array of row indices
+    """
+    if len(obs_ids) == 0:
+        return {}
+
+    # lexsort is stable, so rows of the same event keep their order
+    order = np.lexsort((event_ids, obs_ids))
+    obs_ids = obs_ids[order]
+    event_ids = event_ids[order]
+
+    new_event = (np.diff(obs_ids) != 0) | (np.diff(event_ids) != 0)
+    starts = np.append(0, np.flatnonzero(new_event) + 1)
+    stops = np.append(starts[1:], len(order))
+
+    return {
+        (obs_ids[start], event_ids[start]): order[start:stop]
+        for start, stop in zip(starts, stops)
+    }
+
+
 class DL1EventSource(EventSource):
     """
     Event source for files in the ctapipe DL1 format.
@@ -200,14 +236,22 @@ class DL1EventSource(EventSource):
         data.meta["input_url"] = self.input_url
         data.meta["max_events"] = self.max_events
 
-        if DataLevel.DL1_IMAGES in self.datalevels:
+        # these properties look up nodes in the file,
+        # so only evaluate them once instead of for every telescope event
+        is_simulation = self.is_simulation
+        has_simulated_dl1 = self.has_simulated_dl1
+        datalevels = self.datalevels
+        has_images = DataLevel.DL1_IMAGES in datalevels
+        has_parameters = DataLevel.DL1_PARAMETERS in datalevels
+
+        if has_images:
             image_iterators = {
                 tel.name: self.file_.root.dl1.event.telescope.images[
                     tel.name
                 ].iterrows()
                 for tel in self.file_.root.dl1.event.telescope.images
             }
-            if self.has_simulated_dl1:
+            if has_simulated_dl1:
                 simulated_image_iterators = {
                     tel.name: self.file_.root.simulation.event.telescope.images[
                         tel.name
@@ -215,7 +259,7 @@ class DL1EventSource(EventSource):
                     for tel in self.file_.root.simulation.event.telescope.images
                 }
 
-        if DataLevel.DL1_PARAMETERS in self.datalevels:
+        if has_parameters:
             param_readers = {
                 tel.name: HDF5TableReader(self.file_).read(
                     f"/dl1/event/telescope/parameters/{tel.name}",
@@ -232,7 +276,7 @@ class DL1EventSource(EventSource):
                 )
                 for tel in self.file_.root.dl1.event.telescope.parameters
             }
-            if self.has_simulated_dl1:
+            if has_simulated_dl1:
                 simulated_param_readers = {
                     tel.name: HDF5TableReader(self.file_).read(
                         f"/simulation/event/telescope/parameters/{tel.name}",
@@ -248,7 +292,7 @@ class DL1EventSource(EventSource):
                     for tel in self.file_.root.dl1.event.telescope.parameters
                 }
 
-        if self.is_simulation:
+        if is_simulation:
             # simulated shower wide information
             mc_shower_reader = HDF5TableReader(self.file_).read(
                 "/simulation/event/subarray/shower",
@@ -261,15 +305,26 @@ class DL1EventSource(EventSource):
             "/dl1/event/subarray/trigger", [TriggerContainer(), EventIndexContainer()]
         )
 
-        array_pointing_finder = IndexFinder(
-            self.file_.root.dl1.monitoring.subarray.pointing.col("time")
-        )
+        # keep the pointing table nodes, so their paths are not resolved
+        # again for every event
+        array_pointing = self.file_.root.dl1.monitoring.subarray.pointing
+        array_pointing_finder = IndexFinder(array_pointing.col("time"))
 
+        tel_pointing = {
+            tel.name: tel for tel in self.file_.root.dl1.monitoring.telescope.pointing
+        }
         tel_pointing_finder = {
-            tel.name: IndexFinder(tel.col("time"))
-            for tel in self.file_.root.dl1.monitoring.telescope.pointing
+            name: IndexFinder(table.col("time")) for name, table in tel_pointing.items()
         }
 
+        # group the telescope trigger table by event once, instead of
+        # querying the full table for each event
+        tel_trigger_table = self.file_.root.dl1.event.telescope.trigger[:]
+        tel_trigger_rows = _group_rows_by_event(
+            tel_trigger_table["obs_id"], tel_trigger_table["event_id"]
+        )
+        no_rows = np.array([], dtype=int)
+
         for counter, array_event in enumerate(events):
             data.dl1.tel.clear()
             data.simulation.tel.clear()
@@ -286,9 +341,10 @@ class DL1EventSource(EventSource):
             # Beware: tels_with_trigger contains all triggered telescopes whereas
             # the telescope trigger table contains only the subset of
             # allowed_tels given during the creation of the dl1 file
-            for i in self.file_.root.dl1.event.telescope.trigger.where(
-                f"(obs_id=={data.index.obs_id}) & (event_id=={data.index.event_id})"
-            ):
+            rows = tel_trigger_rows.get(
+                (data.index.obs_id, data.index.event_id), no_rows
+            )
+            for i in tel_trigger_table[rows]:
                 if self.allowed_tels and i["tel_id"] not in self.allowed_tels:
                     continue
                 if self.datamodel_version == "v1.0.0":
@@ -296,19 +352,19 @@ class DL1EventSource(EventSource):
                 else:
                     data.trigger.tel[i["tel_id"]].time = i["time"]
 
-            self._fill_array_pointing(data, array_pointing_finder)
-            self._fill_telescope_pointing(data, tel_pointing_finder)
+            self._fill_array_pointing(data, array_pointing, array_pointing_finder)
+            self._fill_telescope_pointing(data, tel_pointing, tel_pointing_finder)
 
-            if self.is_simulation:
+            if is_simulation:
                 data.simulation.shower = next(mc_shower_reader)
 
             for tel in data.trigger.tel.keys():
                 if self.allowed_tels and tel not in self.allowed_tels:
                     continue
-                if self.has_simulated_dl1:
+                if has_simulated_dl1:
                     simulated = data.simulation.tel[tel]
                 dl1 = data.dl1.tel[tel]
-                if DataLevel.DL1_IMAGES in self.datalevels:
+                if has_images:
                     if f"tel_{tel:03d}" not in image_iterators.keys():
                         logger.debug(
                             f"Triggered telescope {tel} is missing "
@@ -320,7 +376,7 @@ class DL1EventSource(EventSource):
                     dl1.peak_time = image_row["peak_time"]
                     dl1.image_mask = image_row["image_mask"]
 
-                    if self.has_simulated_dl1:
+                    if has_simulated_dl1:
                         if f"tel_{tel:03d}" not in simulated_image_iterators.keys():
                             logger.warning(
                                 f"Triggered telescope {tel} is missing "
@@ -333,7 +389,7 @@ class DL1EventSource(EventSource):
                         )
                         simulated.true_image = simulated_image_row["true_image"]
 
-                if DataLevel.DL1_PARAMETERS in self.datalevels:
+                if has_parameters:
                     if f"tel_{tel:03d}" not in param_readers.keys():
                         logger.debug(
                             f"Triggered telescope {tel} is missing "
@@ -352,7 +408,7 @@ class DL1EventSource(EventSource):
                     dl1.parameters.intensity_statistics = params[5]
                     dl1.parameters.peak_time_statistics = params[6]
 
-                    if self.has_simulated_dl1:
+                    if has_simulated_dl1:
                         if f"tel_{tel:03d}" not in param_readers.keys():
                             logger.debug(
                                 f"Triggered telescope {tel} is missing "
@@ -373,32 +429,33 @@ class DL1EventSource(EventSource):
 
             yield data
 
-    def _fill_array_pointing(self, data, array_pointing_finder):
+    def _fill_array_pointing(self, data, array_pointing, array_pointing_finder):
         """
         Fill the array pointing information of a given event
         """
         # Only unique pointings are stored, so reader.read() wont work as easily
         # Thats why we match the pointings based on trigger time
         closest_time_index = array_pointing_finder.closest(data.trigger.time)
-        array_pointing = self.file_.root.dl1.monitoring.subarray.pointing
+        # read the matching row only once, every index access is a read from disk
+        pointing = array_pointing[closest_time_index]
         data.pointing.array_azimuth = u.Quantity(
-            array_pointing[closest_time_index]["array_azimuth"],
+            pointing["array_azimuth"],
             array_pointing.attrs["array_azimuth_UNIT"],
         )
         data.pointing.array_altitude = u.Quantity(
-            array_pointing[closest_time_index]["array_altitude"],
+            pointing["array_altitude"],
             array_pointing.attrs["array_altitude_UNIT"],
         )
         data.pointing.array_ra = u.Quantity(
-            array_pointing[closest_time_index]["array_ra"],
+            pointing["array_ra"],
             array_pointing.attrs["array_ra_UNIT"],
         )
         data.pointing.array_dec = u.Quantity(
-            array_pointing[closest_time_index]["array_dec"],
+            pointing["array_dec"],
             array_pointing.attrs["array_dec_UNIT"],
         )
 
-    def _fill_telescope_pointing(self, data, tel_pointing_finder):
+    def _fill_telescope_pointing(self, data, tel_pointing, tel_pointing_finder):
         """
         Fill the telescope pointing information of a given event
         """
@@ -406,18 +463,17 @@ class DL1EventSource(EventSource):
         for tel in data.trigger.tel.keys():
             if self.allowed_tels and tel not in self.allowed_tels:
                 continue
-            tel_pointing_table = self.file_.root.dl1.monitoring.telescope.pointing[
-                f"tel_{tel:03d}"
-            ]
-            closest_time_index = tel_pointing_finder[f"tel_{tel:03d}"].closest(
+            tel_name = f"tel_{tel:03d}"
+            tel_pointing_table = tel_pointing[tel_name]
+            closest_time_index = tel_pointing_finder[tel_name].closest(
                 data.trigger.tel[tel].time
             )
-            pointing_telescope = tel_pointing_table
+            pointing_telescope = tel_pointing_table[closest_time_index]
             data.pointing.tel[tel].azimuth = u.Quantity(
-                pointing_telescope[closest_time_index]["azimuth"],
-                pointing_telescope.attrs["azimuth_UNIT"],
+                pointing_telescope["azimuth"],
+                tel_pointing_table.attrs["azimuth_UNIT"],
             )
             data.pointing.tel[tel].altitude = u.Quantity(
-                pointing_telescope[closest_time_index]["altitude"],
-                pointing_telescope.attrs["altitude_UNIT"],
+                pointing_telescope["altitude"],
+                tel_pointing_table.attrs["altitude_UNIT"],
             )
@@ -6,7 +6,7 @@ Class to write DL1 data from an event stream
 
 import pathlib
 from collections import defaultdict
-from typing import DefaultDict, Tuple
+from typing import DefaultDict, Dict, Tuple
 
 import numpy as np
 import tables
@@ -122,6 +122,24 @@ class DL1Writer(Component):
         default_value="blosc:zstd",
     ).tag(config=True)
 
+    compression_threads = Int(
+        help=(
+            "Number of threads used by blosc for compressing data chunks. "
+            "Has no effect for other compressors"
+        ),
+        default_value=1,
+        min=1,
+    ).tag(config=True)
+
+    bitshuffle = Bool(
+        help=(
+            "Use bit-wise instead of byte-wise shuffling before compression. "
+            "This can improve the compression of floating point columns, "
+            "but is only supported by the blosc compressors"
+        ),
+        default_value=False,
+    ).tag(config=True)
+
     write_index_tables = Bool(
         help=(
             "Generate PyTables index datasets for all tables that contain an "
@@ -163,6 +181,7 @@ class DL1Writer(Component):
         self._hdf5_filters = None
         self._last_pointing_tel: DefaultDict[Tuple] = None
         self._last_pointing: Tuple = None
+        self._table_names: Dict[int, str] = None
         self._writer: TableWriter = None
 
     def __enter__(self):
@@ -225,9 +244,17 @@ class DL1Writer(Component):
 
     def _setup_compression(self):
         """ setup HDF5 compression"""
+        if self.bitshuffle and not self.compression_type.startswith("blosc"):
+            raise ToolConfigurationError(
+                f"The option 'bitshuffle' is not supported by {self.compression_type}"
+                ", choose a blosc compressor or disable it"
+            )
+
         self._hdf5_filters = tables.Filters(
             complevel=self.compression_level,
             complib=self.compression_type,
+            shuffle=not self.bitshuffle,
+            bitshuffle=self.bitshuffle,
             fletcher32=True,  # attach a checksum to each chunk for error correction
         )
         self.log.debug("compression filters: %s", self._hdf5_filters)
@@ -269,6 +296,7 @@ class DL1Writer(Component):
             mode="a",
             add_prefix=True,
             filters=self._hdf5_filters,
+            MAX_BLOSC_THREADS=self.compression_threads,
         )
 
         writer.add_column_transform(
@@ -297,6 +325,17 @@ class DL1Writer(Component):
         else:
             table_names = []
 
+        # dataset name of each telescope, resolved once instead of for every
+        # telescope event
+        self._table_names = {
+            tel_id: (
+                f"tel_{tel_id:03d}"
+                if self.split_datasets_by == "tel_id"
+                else str(telescope)
+            )
+            for tel_id, telescope in self._subarray.tel.items()
+        }
+
         for table_name in table_names:
             if self.write_parameters is False:
                 writer.exclude(
@@ -424,7 +463,6 @@ class DL1Writer(Component):
         for tel_id, dl1_camera in event.dl1.tel.items():
             dl1_camera.prefix = ""  # don't want a prefix for this container
             telescope = self._subarray.tel[tel_id]
-            tel_type = str(telescope)
             self.log.debug("WRITING TELESCOPE %s: %s", tel_id, telescope)
 
             tel_index = TelEventIndexContainer(
@@ -443,9 +481,7 @@ class DL1Writer(Component):
                 )
                 self._last_pointing_tel[tel_id] = current_pointing
 
-            table_name = (
-                f"tel_{tel_id:03d}" if self.split_datasets_by == "tel_id" else tel_type
-            )
+            table_name = self._table_names[tel_id]
 
             writer.write(
                 "dl1/event/telescope/trigger", [tel_index, event.trigger.tel[tel_id]]
@@ -105,6 +105,7 @@ class HDF5TableWriter(TableWriter):
         super().__init__(add_prefix=add_prefix, parent=parent, config=config)
         self._schemas = {}
         self._tables = {}
+        self._table_colnames = {}
 
         if mode not in ["a", "w", "r+"]:
             raise IOError(f"The mode '{mode}' is not supported for writing")
@@ -266,6 +267,8 @@ class HDF5TableWriter(TableWriter):
             table.attrs[key] = val
 
         self._tables[table_name] = table
+        # set of column names, fields are checked against it for every row
+        self._table_colnames[table_name] = set(table.colnames)
 
     def _append_row(self, table_name, containers):
         """
@@ -273,11 +276,12 @@ class HDF5TableWriter(TableWriter):
         automatically by `write()`
         """
         table = self._tables[table_name]
+        colnames = self._table_colnames[table_name]
         row = table.row
 
         for container in containers:
             selected_fields = filter(
-                lambda kv: kv[0] in table.colnames,
+                lambda kv: kv[0] in colnames,
                 container.items(add_prefix=self.add_prefix),
             )
             for colname, value in selected_fields:
@@ -1,6 +1,6 @@
 from ctapipe.utils import get_dataset_path
 from ctapipe.io import DataLevel
-from ctapipe.io.dl1eventsource import DL1EventSource
+from ctapipe.io.dl1eventsource import DL1EventSource, _group_rows_by_event
 from ctapipe.io import event_source
 import astropy.units as u
 import subprocess
@@ -91,3 +91,15 @@ def test_pointing(dl1_file):
             for tel in event.pointing.tel:
                 assert np.isclose(event.pointing.tel[tel].azimuth.to_value(u.deg), 0)
                 assert np.isclose(event.pointing.tel[tel].altitude.to_value(u.deg), 70)
+
+
+def test_group_rows_by_event():
+    obs_ids = np.array([1, 1, 2, 1, 2, 1])
+    event_ids = np.array([5, 5, 5, 7, 5, 5])
+    groups = _group_rows_by_event(obs_ids, event_ids)
+
+    assert groups.keys() == {(1, 5), (1, 7), (2, 5)}
+    assert np.all(groups[(1, 5)] == [0, 1, 5])
+    assert np.all(groups[(1, 7)] == [3])
+    assert np.all(groups[(2, 5)] == [2, 4])
+    assert _group_rows_by_event(np.array([]), np.array([])) == {}
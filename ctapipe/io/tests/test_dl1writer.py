@@ -4,12 +4,79 @@ from ctapipe.io.dl1writer import DL1Writer, DL1_DATA_MODEL_VERSION
 from ctapipe.utils import get_dataset_path
 from ctapipe.io import event_source
 from ctapipe.calib import CameraCalibrator
+from ctapipe.containers import ArrayEventContainer, SimulationConfigContainer
+from ctapipe.core import ToolConfigurationError
 from pathlib import Path
-from ctapipe.instrument import SubarrayDescription
+from types import SimpleNamespace
+from ctapipe.instrument import (
+    CameraDescription,
+    CameraGeometry,
+    CameraReadout,
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
+from astropy.time import Time
+import astropy.units as u
+import numpy as np
+import pytest
 import tables
 import logging
 
 
+def _synthetic_source():
+    """
+    Minimal stand-in for an EventSource with two telescopes of a small
+    rectangular camera, so no dataset files are needed
+    """
+    geometry = CameraGeometry.make_rectangular(10, 10)
+    geometry.camera_name = "test"
+    readout = CameraReadout(
+        "test",
+        sampling_rate=1 * u.GHz,
+        reference_pulse_shape=np.ones((1, 10)),
+        reference_pulse_sample_width=1 * u.ns,
+    )
+    optics = OpticsDescription(
+        "test",
+        num_mirrors=1,
+        equivalent_focal_length=28 * u.m,
+        mirror_area=100 * u.m ** 2,
+        num_mirror_tiles=1,
+    )
+    telescope = TelescopeDescription(
+        "test", "MST", optics, CameraDescription("test", geometry, readout)
+    )
+    subarray = SubarrayDescription(
+        "test array",
+        tel_positions={1: [0, 0, 0] * u.m, 3: [100, 0, 0] * u.m},
+        tel_descriptions={1: telescope, 3: telescope},
+    )
+    return SimpleNamespace(
+        is_simulation=False,
+        subarray=subarray,
+        simulation_config=SimulationConfigContainer(),
+        obs_ids=[1],
+    )
+
+
+def _synthetic_events(subarray, n_events=3):
+    """ generate events with random images for all telescopes of the subarray """
+    np.random.seed(0)
+    for event_id in range(n_events):
+        event = ArrayEventContainer()
+        event.index.obs_id = 1
+        event.index.event_id = event_id
+        event.trigger.time = Time(59000, format="mjd")
+        event.trigger.tels_with_trigger = subarray.tel_ids
+        for tel_id in subarray.tel_ids:
+            n_pixels = subarray.tel[tel_id].camera.geometry.n_pixels
+            dl1 = event.dl1.tel[tel_id]
+            dl1.image = np.random.uniform(0, 10, n_pixels).astype(np.float32)
+            dl1.peak_time = np.random.uniform(0, 10, n_pixels).astype(np.float32)
+        yield event
+
+
 def test_dl1writer(tmpdir: Path):
     """
     Check that we can write DL1 files
@@ -63,3 +130,63 @@ def test_dl1writer(tmpdir: Path):
         assert (
             shower._v_attrs["true_alt_UNIT"] == "deg"
         )  # pylint: disable=protected-access
+
+
+def test_dl1writer_bitshuffle(tmpdir: Path):
+    """ Check that bitshuffle is used for the written tables if requested """
+    output_path = Path(tmpdir / "events.dl1.h5")
+    source = _synthetic_source()
+
+    with DL1Writer(
+        event_source=source,
+        output_path=output_path,
+        write_parameters=False,
+        write_images=True,
+        bitshuffle=True,
+    ) as write_dl1:
+        for event in _synthetic_events(source.subarray):
+            write_dl1(event)
+
+    with tables.open_file(output_path) as h5file:
+        for node in (
+            "/dl1/event/subarray/trigger",
+            "/dl1/event/telescope/images/tel_001",
+        ):
+            filters = h5file.get_node(node).filters
+            assert filters.bitshuffle
+            assert not filters.shuffle
+
+
+def test_dl1writer_bitshuffle_unsupported(tmpdir: Path):
+    """ Check that bitshuffle is refused for compressors other than blosc """
+    source = _synthetic_source()
+
+    write_dl1 = DL1Writer(
+        event_source=source,
+        output_path=Path(tmpdir / "events.dl1.h5"),
+        write_parameters=False,
+        write_images=True,
+        compression_type="zlib",
+        bitshuffle=True,
+    )
+
+    with pytest.raises(ToolConfigurationError):
+        write_dl1(next(_synthetic_events(source.subarray)))
+
+
+def test_dl1writer_compression_threads(tmpdir: Path):
+    """ Check that the number of blosc threads is passed on to the output file """
+    source = _synthetic_source()
+
+    with DL1Writer(
+        event_source=source,
+        output_path=Path(tmpdir / "events.dl1.h5"),
+        write_parameters=False,
+        write_images=True,
+        compression_threads=3,
+    ) as write_dl1:
+        for event in _synthetic_events(source.subarray):
+            write_dl1(event)
+
+            h5file = write_dl1._writer._h5file  # pylint: disable=protected-access
+            assert h5file.params["MAX_BLOSC_THREADS"] == 3
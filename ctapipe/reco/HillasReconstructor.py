@@ -11,7 +11,6 @@ from ctapipe.reco.reco_algorithms import (
     TooFewTelescopesException,
 )
 from ctapipe.containers import ReconstructedShowerContainer
-from itertools import combinations
 
 from ctapipe.coordinates import (
     CameraFrame,
@@ -34,23 +33,6 @@ from astropy import units as u
 __all__ = ["HillasReconstructor", "HillasPlane"]
 
 
-def angle(v1, v2):
-    """ computes the angle between two vectors
-        assuming cartesian coordinates
-
-    Parameters
-    ----------
-    v1 : numpy array
-    v2 : numpy array
-
-    Returns
-    -------
-    the angle between v1 and v2 as a dimensioned astropy quantity
-    """
-    norm = np.linalg.norm(v1) * np.linalg.norm(v2)
-    return np.arccos(np.clip(v1.dot(v2) / norm, -1.0, 1.0))
-
-
 def normalise(vec):
     """ Sets the length of the vector to 1
         without changing its direction
@@ -257,7 +239,8 @@ class HillasReconstructor(Reconstructor):
                 p1=cog_coord,
                 p2=p2_coord,
                 telescope_position=subarray.positions[tel_id],
-                weight=moments.intensity * (moments.length / moments.width),
+                weight=moments.intensity
+                * (moments.length / moments.width).to_value(u.one),
             )
             self.hillas_planes[tel_id] = circle
 
@@ -273,28 +256,32 @@ class HillasReconstructor(Reconstructor):
             an error estimate
         """
 
-        crossings = []
-        for perm in combinations(self.hillas_planes.values(), 2):
-            n1, n2 = perm[0].norm, perm[1].norm
-            # cross product automatically weighs in the angle between
-            # the two vectors: narrower angles have less impact,
-            # perpendicular vectors have the most
-            crossing = np.cross(n1, n2)
-
-            # two great circles cross each other twice (one would be
-            # the origin, the other one the direction of the gamma) it
-            # doesn't matter which we pick but it should at least be
-            # consistent: make sure to always take the "upper" solution
-            if crossing[2] < 0:
-                crossing *= -1
-            crossings.append(crossing * perm[0].weight * perm[1].weight)
+        planes = self.hillas_planes.values()
+        norms = np.array([plane.norm for plane in planes])
+        weights = np.array([plane.weight for plane in planes], dtype=np.float64)
+
+        # all pairs of planes, in the same order as itertools.combinations
+        first, second = np.triu_indices(len(norms), k=1)
+
+        # cross product automatically weighs in the angle between
+        # the two vectors: narrower angles have less impact,
+        # perpendicular vectors have the most
+        crossings = np.cross(norms[first], norms[second])
+
+        # two great circles cross each other twice (one would be
+        # the origin, the other one the direction of the gamma) it
+        # doesn't matter which we pick but it should at least be
+        # consistent: make sure to always take the "upper" solution
+        crossings[crossings[:, 2] < 0] *= -1
+        crossings *= (weights[first] * weights[second])[:, np.newaxis]
 
         result = normalise(np.sum(crossings, axis=0))
-        off_angles = [angle(result, cross) for cross in crossings] * u.rad
 
-        err_est_dir = np.average(
-            off_angles, weights=[len(cross) for cross in crossings]
-        )
+        # angles between the (unit) result and all crossings at once
+        cos_off_angles = (crossings @ result) / np.linalg.norm(crossings, axis=1)
+        off_angles = np.arccos(np.clip(cos_off_angles, -1.0, 1.0)) * u.rad
+
+        err_est_dir = np.mean(off_angles)
 
         return result, err_est_dir
 
@@ -328,14 +315,18 @@ class HillasReconstructor(Reconstructor):
         tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
         ground_frame = GroundFrame()
 
-        positions = [
-            (
-                SkyCoord(*plane.pos, frame=ground_frame)
-                .transform_to(tilted_frame)
-                .cartesian.xyz
-            )
-            for plane in self.hillas_planes.values()
-        ]
+        # transform all telescope positions at once, constructing and
+        # transforming one SkyCoord per telescope is very slow
+        ground_positions = u.Quantity(
+            [plane.pos for plane in self.hillas_planes.values()]
+        )
+        ground_coord = SkyCoord(
+            x=ground_positions[:, 0],
+            y=ground_positions[:, 1],
+            z=ground_positions[:, 2],
+            frame=ground_frame,
+        )
+        positions = ground_coord.transform_to(tilted_frame).cartesian.xyz.T
 
         core_position = line_line_intersection_3d(uvw_vectors, positions)
 
@@ -54,13 +54,13 @@ def guess_shower_depth(energy):
 
 
 def energy_prior(energy, index=-1):
-    return -2 * np.log(energy ** index)
+    return -2 * index * np.log(energy)
 
 
 def xmax_prior(energy, xmax, width=100):
     x_max_exp = guess_shower_depth(energy)
     diff = xmax - x_max_exp
-    return -2 * np.log(norm.pdf(diff / width))
+    return -2 * norm.logpdf(diff / width)
 
 
 class ImPACTReconstructor(Reconstructor):
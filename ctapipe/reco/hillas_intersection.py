@@ -9,7 +9,6 @@ performance
 
 """
 import numpy as np
-import itertools
 import astropy.units as u
 from ctapipe.reco.reco_algorithms import (
     Reconstructor,
@@ -61,7 +60,7 @@ class HillasIntersection(Reconstructor):
     ).tag(config=True)
 
     weighting = traits.CaselessStrEnum(
-        ["Konrad", "hess"], default_value="Konrad", help="Weighting Method name"
+        ["Konrad"], default_value="Konrad", help="Weighting Method name"
     ).tag(config=True)
 
     def __init__(self, config=None, parent=None, **kwargs):
@@ -75,9 +74,11 @@ class HillasIntersection(Reconstructor):
         _ = get_atmosphere_profile_functions(self.atmosphere_profile_name)
         self.thickness_profile, self.altitude_profile = _
 
-        # other weighting schemes can be implemented. just add them as additional methods
-        if self.weighting == "Konrad":
-            self._weight_method = self.weight_konrad
+        # bind the weighting method once instead of dispatching on every call,
+        # other weighting schemes can be implemented. just add them as additional
+        # methods and to the weighting enum
+        weight_methods = {"Konrad": self.weight_konrad}
+        self._weight_method = weight_methods[self.weighting]
 
     def predict(self, hillas_dict, subarray, array_pointing, telescopes_pointings=None):
         """
@@ -127,19 +128,19 @@ class HillasIntersection(Reconstructor):
 
         tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
 
-        ground_positions = subarray.tel_coords
+        # look up the array indices once and only transform the positions
+        # of the telescopes taking part in this event
+        tel_ids = list(hillas_dict.keys())
+        tel_indices = subarray.tel_ids_to_indices(tel_ids)
+        ground_positions = subarray.tel_coords[tel_indices]
         grd_coord = GroundFrame(
             x=ground_positions.x, y=ground_positions.y, z=ground_positions.z
         )
 
         tilt_coord = grd_coord.transform_to(tilted_frame)
 
-        tel_x = {
-            tel_id: tilt_coord.x[tel_id - 1] for tel_id in list(hillas_dict.keys())
-        }
-        tel_y = {
-            tel_id: tilt_coord.y[tel_id - 1] for tel_id in list(hillas_dict.keys())
-        }
+        tel_x = dict(zip(tel_ids, tilt_coord.x))
+        tel_y = dict(zip(tel_ids, tilt_coord.y))
 
         nom_frame = NominalFrame(origin=array_pointing)
 
@@ -165,9 +166,6 @@ class HillasIntersection(Reconstructor):
             hillas_dict_mod, tel_x, tel_y
         )
 
-        err_x *= u.rad
-        err_y *= u.rad
-
         nom = SkyCoord(fov_lon=src_x * u.rad, fov_lat=src_y * u.rad, frame=nom_frame)
         # nom = sky_pos.transform_to(nom_frame)
         sky_pos = nom.transform_to(array_pointing.frame)
@@ -184,21 +182,23 @@ class HillasIntersection(Reconstructor):
             90 * u.deg - array_pointing.alt,
         )
 
-        src_error = np.sqrt(err_x ** 2 + err_y ** 2)
+        # wrap the plain float results into quantities only once
+        src_error = u.Quantity(np.sqrt(err_x ** 2 + err_y ** 2), u.rad)
+        altaz = sky_pos.altaz
 
         result = ReconstructedShowerContainer(
-            alt=sky_pos.altaz.alt.to(u.rad),
-            az=sky_pos.altaz.az.to(u.rad),
+            alt=altaz.alt.to(u.rad),
+            az=altaz.az.to(u.rad),
             core_x=grd.x,
             core_y=grd.y,
             core_uncert=u.Quantity(np.sqrt(core_err_x ** 2 + core_err_y ** 2), u.m),
             tel_ids=[h for h in hillas_dict_mod.keys()],
             average_intensity=np.mean([h.intensity for h in hillas_dict_mod.values()]),
             is_valid=True,
-            alt_uncert=src_error.to(u.rad),
-            az_uncert=src_error.to(u.rad),
+            alt_uncert=src_error,
+            az_uncert=src_error,
             h_max=x_max,
-            h_max_uncert=u.Quantity(np.nan * x_max.unit),
+            h_max_uncert=u.Quantity(np.nan, x_max.unit),
             goodness_of_fit=np.nan,
         )
 
@@ -222,54 +222,47 @@ class HillasIntersection(Reconstructor):
         if len(hillas_parameters) < 2:
             return None  # Throw away events with < 2 images
 
-        # Find all pairs of Hillas parameters
-        combos = itertools.combinations(list(hillas_parameters.values()), 2)
-        hillas_pairs = list(combos)
-
         # Copy parameters we need to a numpy array to speed things up
-        h1 = list(
-            map(
-                lambda h: [
-                    h[0].psi.to_value(u.rad),
-                    h[0].x.to_value(u.rad),
-                    h[0].y.to_value(u.rad),
-                    h[0].intensity,
-                ],
-                hillas_pairs,
-            )
-        )
-        h1 = np.array(h1)
-        h1 = np.transpose(h1)
-
-        h2 = list(
-            map(
-                lambda h: [
-                    h[1].psi.to_value(u.rad),
-                    h[1].x.to_value(u.rad),
-                    h[1].y.to_value(u.rad),
-                    h[1].intensity,
-                ],
-                hillas_pairs,
-            )
-        )
-        h2 = np.array(h2)
-        h2 = np.transpose(h2)
+        hillas = np.array(
+            [
+                [
+                    h.psi.to_value(u.rad),
+                    h.x.to_value(u.rad),
+                    h.y.to_value(u.rad),
+                    h.intensity,
+                ]
+                for h in hillas_parameters.values()
+            ]
+        ).T
+
+        # Trigonometry is done once per telescope instead of once per pair
+        sin_psi = np.sin(hillas[0])
+        cos_psi = np.cos(hillas[0])
+
+        # Find all pairs of Hillas parameters
+        first, second = np.triu_indices(len(hillas_parameters), k=1)
+        h1 = hillas[:, first]
+        h2 = hillas[:, second]
 
         # Perform intersection
-        sx, sy = self.intersect_lines(h1[1], h1[2], h1[0], h2[1], h2[2], h2[0])
+        sx, sy, det = _intersect_lines(
+            h1[1],
+            h1[2],
+            sin_psi[first],
+            cos_psi[first],
+            h2[1],
+            h2[2],
+            sin_psi[second],
+            cos_psi[second],
+        )
 
         # Weight by chosen method
         weight = self._weight_method(h1[3], h2[3])
         # And sin of interception angle
-        weight *= self.weight_sin(h1[0], h2[0])
+        weight *= np.abs(det)
 
         # Make weighted average of all possible pairs
-        x_pos = np.average(sx, weights=weight)
-        y_pos = np.average(sy, weights=weight)
-        var_x = np.average((sx - x_pos) ** 2, weights=weight)
-        var_y = np.average((sy - y_pos) ** 2, weights=weight)
-
-        return x_pos, y_pos, np.sqrt(var_x), np.sqrt(var_y)
+        return weighted_mean_std(sx, sy, weight)
 
     def reconstruct_tilted(self, hillas_parameters, tel_x, tel_y):
         """
@@ -293,60 +286,40 @@ class HillasIntersection(Reconstructor):
         """
         if len(hillas_parameters) < 2:
             return None  # Throw away events with < 2 images
-        hill_list = list()
-        tx = list()
-        ty = list()
-
-        # Need to loop here as dict is unordered
-        for tel in hillas_parameters.keys():
-            hill_list.append(hillas_parameters[tel])
-            tx.append(tel_x[tel])
-            ty.append(tel_y[tel])
-
-        # Find all pairs of Hillas parameters
-        hillas_pairs = list(itertools.combinations(hill_list, 2))
-        tel_x = list(itertools.combinations(tx, 2))
-        tel_y = list(itertools.combinations(ty, 2))
-
-        tx = np.zeros((len(tel_x), 2))
-        ty = np.zeros((len(tel_y), 2))
-        for i, _ in enumerate(tel_x):
-            tx[i][0], tx[i][1] = tel_x[i][0].to_value(u.m), tel_x[i][1].to_value(u.m)
-            ty[i][0], ty[i][1] = tel_y[i][0].to_value(u.m), tel_y[i][1].to_value(u.m)
-
-        tel_x = np.array(tx)
-        tel_y = np.array(ty)
+        tel_ids = list(hillas_parameters.keys())
+        hillas = [hillas_parameters[tel] for tel in tel_ids]
 
         # Copy parameters we need to a numpy array to speed things up
-        hillas1 = map(
-            lambda h: [h[0].psi.to_value(u.rad), h[0].intensity], hillas_pairs
-        )
-        hillas1 = np.array(list(hillas1))
-        hillas1 = np.transpose(hillas1)
+        psi = u.Quantity([h.psi for h in hillas]).to_value(u.rad)
+        intensity = np.array([h.intensity for h in hillas])
+        tx = u.Quantity([tel_x[tel] for tel in tel_ids]).to_value(u.m)
+        ty = u.Quantity([tel_y[tel] for tel in tel_ids]).to_value(u.m)
 
-        hillas2 = map(
-            lambda h: [h[1].psi.to_value(u.rad), h[1].intensity], hillas_pairs
-        )
-        hillas2 = np.array(list(hillas2))
-        hillas2 = np.transpose(hillas2)
+        sin_psi = np.sin(psi)
+        cos_psi = np.cos(psi)
+
+        # Find all pairs of Hillas parameters
+        first, second = np.triu_indices(len(tel_ids), k=1)
 
         # Perform intersection
-        crossing_x, crossing_y = self.intersect_lines(
-            tel_x[:, 0], tel_y[:, 0], hillas1[0], tel_x[:, 1], tel_y[:, 1], hillas2[0]
+        crossing_x, crossing_y, det = _intersect_lines(
+            tx[first],
+            ty[first],
+            sin_psi[first],
+            cos_psi[first],
+            tx[second],
+            ty[second],
+            sin_psi[second],
+            cos_psi[second],
         )
 
         # Weight by chosen method
-        weight = self._weight_method(hillas1[1], hillas2[1])
+        weight = self._weight_method(intensity[first], intensity[second])
         # And sin of interception angle
-        weight *= self.weight_sin(hillas1[0], hillas2[0])
+        weight *= np.abs(det)
 
         # Make weighted average of all possible pairs
-        x_pos = np.average(crossing_x, weights=weight)
-        y_pos = np.average(crossing_y, weights=weight)
-        var_x = np.average((crossing_x - x_pos) ** 2, weights=weight)
-        var_y = np.average((crossing_y - y_pos) ** 2, weights=weight)
-
-        return x_pos, y_pos, np.sqrt(var_x), np.sqrt(var_y)
+        return weighted_mean_std(crossing_x, crossing_y, weight)
 
     def reconstruct_xmax(
         self, source_x, source_y, core_x, core_y, hillas_parameters, tel_x, tel_y, zen
@@ -379,33 +352,27 @@ class HillasIntersection(Reconstructor):
         float:
             Estimated depth of shower maximum
         """
-        cog_x = list()
-        cog_y = list()
-        amp = list()
+        tel_ids = list(hillas_parameters.keys())
+        hillas = [hillas_parameters[tel] for tel in tel_ids]
 
-        tx = list()
-        ty = list()
+        cog_x = u.Quantity([h.x for h in hillas]).to_value(u.rad)
+        cog_y = u.Quantity([h.y for h in hillas]).to_value(u.rad)
+        amp = np.array([h.intensity for h in hillas])
 
-        # Loops over telescopes in event
-        for tel in hillas_parameters.keys():
-            cog_x.append(hillas_parameters[tel].x.to_value(u.rad))
-            cog_y.append(hillas_parameters[tel].y.to_value(u.rad))
-            amp.append(hillas_parameters[tel].intensity)
-
-            tx.append(tel_x[tel].to_value(u.m))
-            ty.append(tel_y[tel].to_value(u.m))
+        tx = u.Quantity([tel_x[tel] for tel in tel_ids]).to_value(u.m)
+        ty = u.Quantity([tel_y[tel] for tel in tel_ids]).to_value(u.m)
 
         height = get_shower_height(
             source_x.to_value(u.rad),
             source_y.to_value(u.rad),
-            np.array(cog_x),
-            np.array(cog_y),
+            cog_x,
+            cog_y,
             core_x.to_value(u.m),
             core_y.to_value(u.m),
-            np.array(tx),
-            np.array(ty),
+            tx,
+            ty,
         )
-        weight = np.array(amp)
+        weight = amp
         mean_height = np.sum(height * weight) / np.sum(weight)
 
         # This value is height above telescope in the tilted system,
@@ -449,37 +416,72 @@ class HillasIntersection(Reconstructor):
         -------
         ndarray of x and y crossing points for all pairs
         """
-        sin_1 = np.sin(phi1)
-        cos_1 = np.cos(phi1)
-        a1 = sin_1
-        b1 = -1 * cos_1
-        c1 = yp1 * cos_1 - xp1 * sin_1
+        xs, ys, _ = _intersect_lines(
+            xp1, yp1, np.sin(phi1), np.cos(phi1), xp2, yp2, np.sin(phi2), np.cos(phi2)
+        )
+        return xs, ys
 
-        sin_2 = np.sin(phi2)
-        cos_2 = np.cos(phi2)
+    @staticmethod
+    def weight_konrad(p1, p2):
+        return (p1 * p2) / (p1 + p2)
 
-        a2 = sin_2
-        b2 = -1 * cos_2
-        c2 = yp2 * cos_2 - xp2 * sin_2
 
-        det_ab = a1 * b2 - a2 * b1
-        det_bc = b1 * c2 - b2 * c1
-        det_ca = c1 * a2 - c2 * a1
+def _intersect_lines(xp1, yp1, sin_1, cos_1, xp2, yp2, sin_2, cos_2):
+    """
+    Intersection of two lines given by a point and the sine and cosine of
+    their rotation angle, see `HillasIntersection.intersect_lines`.
 
-        # if  math.fabs(det_ab) < 1e-14 : # /* parallel */
-        #    return 0,0
-        xs = det_bc / det_ab
-        ys = det_ca / det_ab
+    Also returns the determinant ``sin(phi2 - phi1)``, whose absolute value
+    is the sine of the interception angle used for weighting.
+    """
+    a1 = sin_1
+    b1 = -1 * cos_1
+    c1 = yp1 * cos_1 - xp1 * sin_1
 
-        return xs, ys
+    a2 = sin_2
+    b2 = -1 * cos_2
+    c2 = yp2 * cos_2 - xp2 * sin_2
 
-    @staticmethod
-    def weight_konrad(p1, p2):
-        return (p1 * p2) / (p1 + p2)
+    det_ab = a1 * b2 - a2 * b1
+    det_bc = b1 * c2 - b2 * c1
+    det_ca = c1 * a2 - c2 * a1
 
-    @staticmethod
-    def weight_sin(phi1, phi2):
-        return np.abs(np.sin(phi1 - phi2))
+    # if  math.fabs(det_ab) < 1e-14 : # /* parallel */
+    #    return 0,0
+    xs = det_bc / det_ab
+    ys = det_ca / det_ab
+
+    return xs, ys, det_ab
+
+
+def weighted_mean_std(x, y, weights):
+    """
+    Weighted mean and standard deviation of a set of points in 2d.
+
+    Parameters
+    ----------
+    x: ndarray
+        X positions of the points
+    y: ndarray
+        Y positions of the points
+    weights: ndarray
+        Weight of each point
+
+    Returns
+    -------
+    (float, float, float, float):
+        mean x, mean y, standard deviation x, standard deviation y
+    """
+    sum_of_weights = np.sum(weights)
+    if sum_of_weights == 0:
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+
+    weights = weights / sum_of_weights
+    points = np.stack([x, y])
+    mean = points @ weights
+    std = np.sqrt(((points - mean[:, np.newaxis]) ** 2) @ weights)
+
+    return mean[0], mean[1], std[0], std[1]
 
 
 def get_shower_height(
@@ -513,9 +515,9 @@ def get_shower_height(
     """
 
     # Calculate displacement of image centroid from source position (in rad)
-    disp = np.sqrt((cog_x - source_x) ** 2 + (cog_y - source_y) ** 2)
+    disp = np.hypot(cog_x - source_x, cog_y - source_y)
     # Calculate impact parameter of the shower
-    impact = np.sqrt((tel_pos_x - core_x) ** 2 + (tel_pos_y - core_y) ** 2)
+    impact = np.hypot(tel_pos_x - core_x, tel_pos_y - core_y)
 
     # Distance above telescope is ration of these two (small angle)
     height = impact / disp
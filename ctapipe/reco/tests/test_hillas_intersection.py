@@ -1,10 +1,17 @@
-from ctapipe.reco.hillas_intersection import HillasIntersection
+from ctapipe.reco.hillas_intersection import HillasIntersection, weighted_mean_std
 import astropy.units as u
 from numpy.testing import assert_allclose
 import numpy as np
+import pytest
+from traitlets import TraitError
 from astropy.coordinates import SkyCoord
 from ctapipe.coordinates import NominalFrame, AltAz, CameraFrame
 from ctapipe.containers import HillasParametersContainer
+from ctapipe.instrument import (
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
 
 from ctapipe.io import event_source
 
@@ -228,6 +235,56 @@ def test_intersection_nominal_reconstruction():
     )
 
 
+def test_predict_non_contiguous_tel_ids():
+    """
+    Test that the telescope positions are looked up by tel_id and not by
+    position in the subarray, using a subarray with gaps in its tel_ids.
+    The image axes of telescopes 2, 4 and 5 all point to a known core position.
+    """
+    optics = OpticsDescription(
+        "test",
+        num_mirrors=1,
+        equivalent_focal_length=28 * u.m,
+        mirror_area=100 * u.m ** 2,
+        num_mirror_tiles=1,
+    )
+    telescope = TelescopeDescription("test", "MST", optics, None)
+    positions = {
+        1: [-200, 0, 0],
+        2: [100, 100, 0],
+        4: [-100, 100, 0],
+        5: [-100, -100, 0],
+        6: [300, -50, 0],
+    }
+    subarray = SubarrayDescription(
+        "test array",
+        tel_positions={tel_id: pos * u.m for tel_id, pos in positions.items()},
+        tel_descriptions={tel_id: telescope for tel_id in positions},
+    )
+
+    core_x, core_y = 20.0, -30.0
+    hillas_dict = {}
+    for tel_id in (2, 4, 5):
+        psi = np.arctan2(core_y - positions[tel_id][1], core_x - positions[tel_id][0])
+        hillas_dict[tel_id] = HillasParametersContainer(
+            x=0.1 * u.m * np.cos(psi),
+            y=0.1 * u.m * np.sin(psi),
+            intensity=100,
+            width=0.05 * u.m,
+            length=0.1 * u.m,
+            psi=psi * u.rad,
+        )
+
+    # pointing to zenith, so the tilted and ground frames coincide
+    array_pointing = SkyCoord(alt=90 * u.deg, az=0 * u.deg, frame=AltAz())
+
+    result = HillasIntersection().predict(hillas_dict, subarray, array_pointing)
+
+    assert result.tel_ids == [2, 4, 5]
+    assert_allclose(result.core_x.to_value(u.m), core_x, atol=1e-6)
+    assert_allclose(result.core_y.to_value(u.m), core_y, atol=1e-6)
+
+
 def test_reconstruction():
     """
     a test of the complete fit procedure on one event including:
@@ -297,3 +354,34 @@ def test_reconstruction():
         assert fit_result.is_valid
 
     assert reconstructed_events > 0
+
+
+def test_weighted_mean_std():
+    """
+    Check the fused weighted mean / standard deviation against np.average
+    """
+    np.random.seed(0)
+    x = np.random.normal(size=10)
+    y = np.random.normal(size=10)
+    weights = np.random.uniform(size=10)
+
+    mean_x, mean_y, std_x, std_y = weighted_mean_std(x, y, weights)
+
+    assert_allclose(mean_x, np.average(x, weights=weights))
+    assert_allclose(mean_y, np.average(y, weights=weights))
+    assert_allclose(std_x, np.sqrt(np.average((x - mean_x) ** 2, weights=weights)))
+    assert_allclose(std_y, np.sqrt(np.average((y - mean_y) ** 2, weights=weights)))
+
+
+def test_weighting_method():
+    hill_inter = HillasIntersection(weighting="konrad")
+    assert hill_inter._weight_method == hill_inter.weight_konrad
+
+    with pytest.raises(TraitError):
+        HillasIntersection(weighting="hess")
+
+    with pytest.raises(TraitError):
+        hill_inter.weighting = "hess"
+
+    assert hill_inter.weighting == "Konrad"
+    assert hill_inter._weight_method == hill_inter.weight_konrad
@@ -85,7 +85,7 @@ class SingleTelEventDisplay(Tool):
             self.event_source,
             desc=f"Tel{self.tel}",
             total=self.event_source.max_events,
-            disable=~self.progress,
+            disable=not self.progress,
         ):
 
             self.log.debug(event.trigger)
@@ -127,6 +127,11 @@ class MergeTool(Tool):
     file_pattern = traits.Unicode(
         default_value="*.h5", help="Give a specific file pattern for the input files"
     ).tag(config=True)
+    chunk_size = traits.Int(
+        default_value=10000,
+        min=1,
+        help="Number of rows of telescope tables to read and append at once",
+    ).tag(config=True)
 
     parser = ArgumentParser()
     parser.add_argument("input_files", nargs="*", type=Path)
@@ -255,14 +260,16 @@ class MergeTool(Tool):
             table_out = self.output_file.root[image_statistics_path]
             table_in = file.root[image_statistics_path]
 
-            for row in range(len(table_in)):
-                table_out.cols.counts[row] = np.add(
-                    table_out.cols.counts[row], table_in.cols.counts[row]
-                )
-                table_out.cols.cumulative_counts[row] = np.add(
-                    table_out.cols.cumulative_counts[row],
-                    table_in.cols.cumulative_counts[row],
-                )
+            # add whole columns at once instead of reading and writing
+            # each row separately
+            n_rows = len(table_in)
+            table_out.cols.counts[:n_rows] = np.add(
+                table_out.cols.counts[:n_rows], table_in.cols.counts[:]
+            )
+            table_out.cols.cumulative_counts[:n_rows] = np.add(
+                table_out.cols.cumulative_counts[:n_rows],
+                table_in.cols.cumulative_counts[:],
+            )
 
         elif "/dl1/service" not in self.output_file:
             target_group = self.output_file.create_group(
@@ -289,10 +296,7 @@ class MergeTool(Tool):
                         if tel_node_path in self.output_file:
                             output_node = self.output_file.get_node(tel_node_path)
                             input_node = file.root[tel_node_path]
-
-                            # cast needed for some image parameters that are sometimes
-                            # float32 and sometimes float64
-                            output_node.append(input_node[:].astype(output_node.dtype))
+                            self._append_in_chunks(output_node, input_node)
                         else:
                             target_group = self.output_file.root[node]
                             file.copy_node(tel, newparent=target_group)
@@ -330,6 +334,15 @@ class MergeTool(Tool):
                     else:
                         file.copy_node(node, newparent=target_group)
 
+    def _append_in_chunks(self, output_node, input_node):
+        # append in chunks of rows, so that large telescope tables
+        # (e.g. images) are never loaded into memory completely
+        for start in range(0, len(input_node), self.chunk_size):
+            data = input_node.read(start, start + self.chunk_size)
+            # cast needed for some image parameters that are sometimes
+            # float32 and sometimes float64
+            output_node.append(data.astype(output_node.dtype, copy=False))
+
     def _create_group(self, node):
         head, tail = os.path.split(node)
         self.output_file.create_group(head, tail, createparents=True)
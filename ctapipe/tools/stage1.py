@@ -3,7 +3,7 @@ Generate DL1 (a or b) output files in HDF5 format from {R0,R1,DL0} inputs.
 """
 import sys
 
-from tqdm.autonotebook import tqdm
+from tqdm import tqdm
 
 from ..calib.camera import CameraCalibrator, GainSelector
 from ..core import Tool
@@ -37,7 +37,9 @@ def test_merge(tmpdir):
         suffix=".hdf5"
     ) as out_skip_images, tempfile.NamedTemporaryFile(
         suffix=".hdf5"
-    ) as out_skip_parameters:
+    ) as out_skip_parameters, tempfile.NamedTemporaryFile(
+        suffix=".hdf5"
+    ) as out_small_chunks:
         assert (
             run_tool(
                 Stage1Tool(),
@@ -108,6 +110,22 @@ def test_merge(tmpdir):
             == 0
         )
 
+        # tables longer than the chunk size are appended in several chunks
+        assert (
+            run_tool(
+                MergeTool(),
+                argv=[
+                    f"{f1.name}",
+                    f"{f2.name}",
+                    f"--o={out_small_chunks.name}",
+                    "--overwrite",
+                    "--MergeTool.chunk_size=3",
+                ],
+                cwd=tmpdir,
+            )
+            == 0
+        )
+
         out_files_list = [out_all.name, out_skip_images.name, out_skip_parameters.name]
 
         for out_file in out_files_list:
@@ -169,6 +187,18 @@ def test_merge(tmpdir):
                             len(in_f.root.dl1.event.telescope.parameters[tel.name]), 2
                         )
 
+        # merging in small chunks must not change the result
+        with tables.open_file(out_all.name, mode="r") as all_f, tables.open_file(
+            out_small_chunks.name, mode="r"
+        ) as chunks_f:
+            for table in all_f.walk_nodes("/", classname="Table"):
+                chunked_table = chunks_f.get_node(table._v_pathname)
+                assert len(chunked_table) == len(table)
+                for col in table.colnames:
+                    np.testing.assert_array_equal(
+                        chunked_table.col(col), table.col(col)
+                    )
+
 
 def test_stage_1(tmpdir):
     from ctapipe.tools.stage1 import Stage1Tool